@@ -111,6 +111,10 @@ class _TopicWriteState:
                 f"Ontology class for tag '{ontology_tag}' not registered in Message."
             )
 
+        # The Arrow schema only depends on the ontology class: build it once
+        # instead of for every record batch (one per pushed message in bytes mode)
+        self._schema: pa.Schema = Message._get_schema(self.ontology_type)
+
         if self.max_batch_size_bytes is None or self.max_batch_size_records is None:
             raise RuntimeError(
                 "'max_batch_size_bytes' AND 'max_batch_size_records' must be provided."
@@ -140,11 +144,10 @@ class _TopicWriteState:
         """
         if self.writer is None:
             raise ValueError("Writer is None")
-        assert self.ontology_type is not None
 
         return pa.RecordBatch.from_pydict(
             _encode_messages(msgs),
-            schema=Message._get_schema(self.ontology_type),
+            schema=self._schema,
         )
 
     def _get_serialized_size(self, batch: pa.RecordBatch) -> int:
@@ -1,3 +1,8 @@
+from typing import List, Optional, Sequence
+
+from ..header import Header
+
+
 def _fix_empty_dicts(obj):
     """
     Recursively replaces dictionaries where all values are None
@@ -20,3 +25,36 @@ def _fix_empty_dicts(obj):
         return fixed
     # If not a dict, return the object unchanged
     return obj
+
+
+def _validate_batch_headers(
+    headers: Optional[Sequence[Optional[Header]]], size: int
+) -> List[Optional[Header]]:
+    """
+    Validates the per-sample headers of a batch built with `model_construct`.
+
+    The batch factories check the sample values with vectorized masks, then skip
+    the per-instance validation: the headers are validated here instead, so that
+    only `Header` instances (or `None`) reach the built objects.
+
+    Raises:
+        ValueError: If the number of headers differs from `size`, or if a header
+            is not a valid `Header`.
+    """
+    if headers is None:
+        return [None] * size
+    if len(headers) != size:
+        raise ValueError(
+            f"Expected {size} headers, one per sample. Got {len(headers)}."
+        )
+
+    validated = []
+    for idx, header in enumerate(headers):
+        if header is None or type(header) is Header:
+            validated.append(header)
+            continue
+        try:
+            validated.append(Header.model_validate(header))
+        except ValueError as e:
+            raise ValueError(f"Sample {idx}: Invalid header. {e}") from e
+    return validated
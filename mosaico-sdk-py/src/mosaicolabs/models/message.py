@@ -8,7 +8,8 @@ middleware-level metadata (like recording timestamp_ns).
 """
 
 # --- Python Standard Library Imports ---
-from typing import Any, Dict, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
 from mosaicolabs.models.header import Header, Time
 from pydantic import PrivateAttr
 import pyarrow as pa
@@ -30,6 +31,17 @@ def _make_schema(*args: pa.StructType) -> pa.Schema:
     return pa.schema([field for struct in args for field in struct])
 
 
+@lru_cache(maxsize=None)
+def _get_model_keys(model_cls: type, exclude: Tuple[str, ...] = ()) -> frozenset:
+    """
+    Returns the (cached) field names of a model class.
+
+    The fields of a class are fixed at definition time, so the same frozenset
+    is shared by all the instances instead of being rebuilt for each message.
+    """
+    return frozenset(field for field in model_cls.model_fields if field not in exclude)
+
+
 TSerializable = TypeVar("TSerializable", bound="Serializable")
 
 
@@ -89,8 +101,9 @@ class Message(BaseModel):
     """
 
     # Internal cache for efficient field separation during encoding
-    _self_model_keys: set[str] = PrivateAttr(default_factory=set)
-    _data_model_keys: set[str] = PrivateAttr(default_factory=set)
+    # (shared per class, see `_get_model_keys`)
+    _self_model_keys: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _data_model_keys: frozenset[str] = PrivateAttr(default_factory=frozenset)
 
     def model_post_init(self, context: Any) -> None:
         """
@@ -119,10 +132,8 @@ class Message(BaseModel):
         if data_header is None:
             self.data.header = Header(stamp=Time.from_nanoseconds(timestamp))
 
-        self._self_model_keys = {
-            field for field in self.__class__.model_fields if field != "data"
-        }
-        self._data_model_keys = {field for field in self.data.__class__.model_fields}
+        self._self_model_keys = _get_model_keys(self.__class__, exclude=("data",))
+        self._data_model_keys = _get_model_keys(self.data.__class__)
 
         colliding_fields = self._self_model_keys & self._data_model_keys
         if colliding_fields:
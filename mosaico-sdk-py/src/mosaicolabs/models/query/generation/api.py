@@ -43,6 +43,8 @@ class _QueryProxy:
         # and prevent recursion loops.
         self.__path__ = full_path
         self.__map__ = field_map
+        # Nested proxies, created on first access and then reused
+        self.__children__: Dict[str, "_QueryProxy"] = {}
 
     def __getattr__(self, name: str) -> Union["_QueryProxy", _QueryableField]:
         """
@@ -71,11 +73,16 @@ class _QueryProxy:
 
         if isinstance(child, dict):
             # This is a nested struct (e.g., 'position').
-            # Return a *new* QueryProxy instance for this deeper path.
-            return _QueryProxy(
-                full_path=f"{self.__path__}.{name}",  # e.g., "gps.position"
-                field_map=child,  # The nested field map
-            )
+            # Return the QueryProxy for this deeper path, building it (and its
+            # path string) only the first time it is accessed.
+            proxy = self.__children__.get(name)
+            if proxy is None:
+                proxy = _QueryProxy(
+                    full_path=f"{self.__path__}.{name}",  # e.g., "gps.position"
+                    field_map=child,  # The nested field map
+                )
+                self.__children__[name] = proxy
+            return proxy
         else:
             # This is a simple field (a _QueryableField instance).
             # Return it directly.
@@ -4,12 +4,20 @@ Pressure Ontology Module.
 Defines the data structure for pressure sensors.
 """
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import pyarrow as pa
 
 from ..mixins import HeaderMixin, VarianceMixin
 from ..serializable import Serializable
-from ..header import Header
+
+if TYPE_CHECKING:
+    from ..header import Header
+
+# Reciprocals of the Pascal conversion factors, so that the `to_*` conversions
+# are a multiplication instead of a division.
+_INV_ATM = 1.0 / 101325.0
+_INV_BAR = 1.0e-5
+_INV_PSI = 1.0 / 6894.7572931783
 
 
 class Pressure(Serializable, HeaderMixin, VarianceMixin):
@@ -123,7 +131,7 @@ class Pressure(Serializable, HeaderMixin, VarianceMixin):
         cls,
         *,
         value: float,
-        header: Optional[Header] = None,
+        header: Optional["Header"] = None,
         variance: Optional[float] = None,
         variance_type: Optional[int] = None,
     ) -> "Pressure":
@@ -153,7 +161,7 @@ class Pressure(Serializable, HeaderMixin, VarianceMixin):
         cls,
         *,
         value: float,
-        header: Optional[Header] = None,
+        header: Optional["Header"] = None,
         variance: Optional[float] = None,
         variance_type: Optional[int] = None,
     ) -> "Pressure":
@@ -183,7 +191,7 @@ class Pressure(Serializable, HeaderMixin, VarianceMixin):
         cls,
         *,
         value: float,
-        header: Optional[Header] = None,
+        header: Optional["Header"] = None,
         variance: Optional[float] = None,
         variance_type: Optional[int] = None,
     ) -> "Pressure":
@@ -216,7 +224,7 @@ class Pressure(Serializable, HeaderMixin, VarianceMixin):
         Returns:
             float: The `Pressure` value in Atm.
         """
-        return self.value / 101325
+        return self.value * _INV_ATM
 
     def to_bar(self) -> float:
         """
@@ -226,7 +234,7 @@ class Pressure(Serializable, HeaderMixin, VarianceMixin):
         Returns:
             float: The `Pressure` value in Bar.
         """
-        return self.value / 100000
+        return self.value * _INV_BAR
 
     def to_psi(self) -> float:
         """
@@ -236,4 +244,4 @@ class Pressure(Serializable, HeaderMixin, VarianceMixin):
         Returns:
             float: The `Pressure` value in Psi.
         """
-        return self.value / 6894.7572931783
+        return self.value * _INV_PSI
@@ -4,13 +4,21 @@ Range Ontology Module.
 Defines the data structure for range sensors.
 """
 
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
 import pyarrow as pa
+from numpy.typing import ArrayLike
 from typing_extensions import Self
 from pydantic import model_validator
 
+from ..internal.helpers import _validate_batch_headers
 from ..mixins import HeaderMixin, VarianceMixin
 from ..serializable import Serializable
 
+if TYPE_CHECKING:
+    from ..header import Header
+
 
 class Range(Serializable, HeaderMixin, VarianceMixin):
     """
@@ -277,23 +285,147 @@ class Range(Serializable, HeaderMixin, VarianceMixin):
     """
 
     @model_validator(mode="after")
-    def validate_min_and_max_range(self) -> Self:
-        """Ensures that `min_range` is smaller or equal to `max_range`."""
+    def validate_range(self) -> Self:
+        """
+        Ensures that `min_range` is smaller or equal to `max_range` and that
+        `range` is between them.
+
+        A valid sample only pays for the single chained comparison; the
+        failing invariant is identified only when it does not hold.
+        """
+        if self.min_range <= self.range <= self.max_range:
+            return self
+
         if self.min_range > self.max_range:
             raise ValueError(
                 "The min_range must be smaller or equal to max_range. "
                 f"Got {self.min_range} as min_range and {self.max_range} as max_range."
             )
 
-        return self
+        raise ValueError(
+            "The range must be between min_range and max_range. "
+            f"Got {self.range} as range, {self.min_range} as min_range and {self.max_range} as max_range."
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        radiation_type: ArrayLike,
+        field_of_view: ArrayLike,
+        min_range: ArrayLike,
+        max_range: ArrayLike,
+        range: ArrayLike,
+        headers: Optional[Sequence[Optional["Header"]]] = None,
+    ) -> List["Range"]:
+        """
+        Builds a batch of `Range` measurements from column arrays.
+
+        The inputs are cast once to the physical types of the Arrow schema
+        (`uint8` for `radiation_type`, `float32` for the other fields), so the
+        values stored in the returned instances already carry the precision
+        they will be serialized with. The range invariants are checked on
+        the whole batch with NumPy masks instead of one sample at a time, so
+        the instances are then built with `model_construct`, without running
+        the per-instance validators again.
+
+        Args:
+            radiation_type (ArrayLike): Radiation type of each sample.
+            field_of_view (ArrayLike): Field of view of each sample, in **Radians (rad)**.
+            min_range (ArrayLike): Minimum range of each sample, in **Meters (m)**.
+            max_range (ArrayLike): Maximum range of each sample, in **Meters (m)**.
+            range (ArrayLike): Range value of each sample, in **Meters (m)**.
+            headers (Optional[Sequence[Optional[Header]]]): Optional per-sample headers.
+
+        Returns:
+            List[Range]: One instance per sample, in input order.
+
+        Raises:
+            ValueError: If the arrays are not one-dimensional with the same length,
+                if a header is not a valid `Header`, if a `radiation_type` is not an
+                integer in the `uint8` range, or if a sample violates the
+                `min_range <= range <= max_range` invariant.
+
+        Example:
+            ```python
+            import numpy as np
+            from mosaicolabs import Range
+
+            ranges = Range.from_arrays(
+                radiation_type=np.zeros(3),
+                field_of_view=np.full(3, 0.1),
+                min_range=np.full(3, 0.2),
+                max_range=np.full(3, 4.0),
+                range=np.array([0.5, 1.0, 3.5]),
+            )
+            ```
+        """
+        # Kept as given until checked: the cast to uint8 would silently wrap
+        # or truncate the out of range and non integral values
+        rad_type = np.asarray(radiation_type)
+        columns = {
+            "radiation_type": rad_type,
+            "field_of_view": np.ascontiguousarray(field_of_view, dtype=np.float32),
+            "min_range": np.ascontiguousarray(min_range, dtype=np.float32),
+            "max_range": np.ascontiguousarray(max_range, dtype=np.float32),
+            "range": np.ascontiguousarray(range, dtype=np.float32),
+        }
+
+        lengths = {name: col.shape for name, col in columns.items()}
+        if any(len(shape) != 1 for shape in lengths.values()) or (
+            len(set(lengths.values())) != 1
+        ):
+            raise ValueError(
+                f"All the input arrays must be one-dimensional with the same length. Got shapes {lengths}."
+            )
 
-    @model_validator(mode="after")
-    def validate_range(self) -> Self:
-        """Ensures that `range` is between `min_range` and `max_range`."""
-        if not self.min_range <= self.range <= self.max_range:
+        size = columns["range"].shape[0]
+        headers = _validate_batch_headers(headers, size)
+
+        if rad_type.dtype == np.bool_ or np.issubdtype(rad_type.dtype, np.number):
+            bad_rad_type = (
+                (rad_type < 0) | (rad_type > 255) | (rad_type != np.floor(rad_type))
+            )
+        else:
+            # Non numeric input (e.g. strings): no value can be a radiation type
+            bad_rad_type = np.ones(rad_type.shape, dtype=bool)
+        if bad_rad_type.any():
+            idx = int(np.argmax(bad_rad_type))
             raise ValueError(
-                "The range must be between min_range and max_range. "
-                f"Got {self.range} as range, {self.min_range} as min_range and {self.max_range} as max_range."
+                f"Sample {idx}: The radiation_type must be an integer between 0 and 255. "
+                f"Got {rad_type[idx]} as radiation_type."
+            )
+        columns["radiation_type"] = np.ascontiguousarray(rad_type, dtype=np.uint8)
+
+        # Same checks (and messages) as the per-instance validators,
+        # reported for the first offending sample
+        min_r, max_r, rng = columns["min_range"], columns["max_range"], columns["range"]
+        bad_bounds = min_r > max_r
+        if bad_bounds.any():
+            idx = int(np.argmax(bad_bounds))
+            raise ValueError(
+                f"Sample {idx}: The min_range must be smaller or equal to max_range. "
+                f"Got {min_r[idx]} as min_range and {max_r[idx]} as max_range."
+            )
+        bad_range = ~((min_r <= rng) & (rng <= max_r))
+        if bad_range.any():
+            idx = int(np.argmax(bad_range))
+            raise ValueError(
+                f"Sample {idx}: The range must be between min_range and max_range. "
+                f"Got {rng[idx]} as range, {min_r[idx]} as min_range and {max_r[idx]} as max_range."
             )
 
-        return self
+        # Convert each column to Python scalars in a single pass; the batch
+        # has already been validated above
+        return [
+            cls.model_construct(
+                header=header,
+                radiation_type=rad_t,
+                field_of_view=fov,
+                min_range=min_v,
+                max_range=max_v,
+                range=rng_v,
+            )
+            for header, rad_t, fov, min_v, max_v, rng_v in zip(
+                headers, *(col.tolist() for col in columns.values())
+            )
+        ]
@@ -5,8 +5,10 @@ Defines the `RobotJoint` model for capturing the state (position, velocity, effo
 of a robot's actuators.
 """
 
-from typing import List
+from typing import Any, List
+import numpy as np
 import pyarrow as pa
+from pydantic import field_validator
 
 from ..mixins import HeaderMixin
 from ..serializable import Serializable
@@ -104,3 +106,17 @@ class RobotJoint(Serializable, HeaderMixin):
     ### Querying with the **`.Q` Proxy**
     The efforts are not queryable via the `.Q` proxy (Lists are not supported yet).
     """
+
+    @field_validator("positions", "velocities", "efforts", mode="before")
+    @classmethod
+    def convert_ndarray(cls, v: Any) -> Any:
+        """
+        Converts NumPy arrays to lists in a single bulk operation.
+
+        Joint states usually come as contiguous float64 arrays (e.g. from ROS
+        `JointState` or from a batch of samples): converting them at once is
+        much cheaper than letting the validation iterate over the NumPy scalars.
+        """
+        if isinstance(v, np.ndarray):
+            return v.astype(np.float64, copy=False).tolist()
+        return v
@@ -4,12 +4,17 @@ Temperature Ontology Module.
 Defines the data structure for temperature sensors.
 """
 
-from typing import Optional
+from typing import List, Optional, Sequence, TYPE_CHECKING
+import numpy as np
 import pyarrow as pa
+from numpy.typing import ArrayLike
 
+from ..internal.helpers import _validate_batch_headers
 from ..mixins import HeaderMixin, VarianceMixin
 from ..serializable import Serializable
-from ..header import Header
+
+if TYPE_CHECKING:
+    from ..header import Header
 
 
 class Temperature(Serializable, HeaderMixin, VarianceMixin):
@@ -120,7 +125,7 @@ class Temperature(Serializable, HeaderMixin, VarianceMixin):
         cls,
         *,
         value: float,
-        header: Optional[Header] = None,
+        header: Optional["Header"] = None,
         variance: Optional[float] = None,
         variance_type: Optional[int] = None,
     ) -> "Temperature":
@@ -150,7 +155,7 @@ class Temperature(Serializable, HeaderMixin, VarianceMixin):
         cls,
         *,
         value: float,
-        header: Optional[Header] = None,
+        header: Optional["Header"] = None,
         variance: Optional[float] = None,
         variance_type: Optional[int] = None,
     ) -> "Temperature":
@@ -175,6 +180,111 @@ class Temperature(Serializable, HeaderMixin, VarianceMixin):
             variance_type=variance_type,
         )
 
+    @classmethod
+    def from_celsius_batch(
+        cls,
+        values: ArrayLike,
+        headers: Optional[Sequence[Optional["Header"]]] = None,
+        variances: Optional[ArrayLike] = None,
+        variance_type: Optional[int] = None,
+    ) -> List["Temperature"]:
+        """
+        Creates a batch of `Temperature` instances from values in Celsius, converting
+        the whole array in Kelvin at once using the formula `Kelvin = Celsius + 273.15`.
+
+        Args:
+            values (ArrayLike): The one-dimensional array of temperature values in Celsius.
+            headers (Optional[Sequence[Optional[Header]]]): Optional per-sample headers.
+            variances (Optional[ArrayLike]): Optional per-sample variances of the data.
+            variance_type (Optional[int]): Enum integer representing the variance
+                parameterization, shared by the whole batch.
+
+        Returns:
+            List[Temperature]: One `Temperature` instance (with value in Kelvin) per sample.
+        """
+        values_in_kelvin = np.asarray(values, dtype=np.float64) + 273.15
+        return cls._from_kelvin_array(
+            values_in_kelvin, headers, variances, variance_type
+        )
+
+    @classmethod
+    def from_fahrenheit_batch(
+        cls,
+        values: ArrayLike,
+        headers: Optional[Sequence[Optional["Header"]]] = None,
+        variances: Optional[ArrayLike] = None,
+        variance_type: Optional[int] = None,
+    ) -> List["Temperature"]:
+        """
+        Creates a batch of `Temperature` instances from values in Fahrenheit, converting
+        the whole array in Kelvin at once using the formula
+        `Kelvin = (Fahrenheit - 32) * 5 / 9 + 273.15`.
+
+        Args:
+            values (ArrayLike): The one-dimensional array of temperature values in Fahrenheit.
+            headers (Optional[Sequence[Optional[Header]]]): Optional per-sample headers.
+            variances (Optional[ArrayLike]): Optional per-sample variances of the data.
+            variance_type (Optional[int]): Enum integer representing the variance
+                parameterization, shared by the whole batch.
+
+        Returns:
+            List[Temperature]: One `Temperature` instance (with value in Kelvin) per sample.
+        """
+        values_in_kelvin = (np.asarray(values, dtype=np.float64) - 32) * 5 / 9 + 273.15
+        return cls._from_kelvin_array(
+            values_in_kelvin, headers, variances, variance_type
+        )
+
+    @classmethod
+    def _from_kelvin_array(
+        cls,
+        values_in_kelvin: np.ndarray,
+        headers: Optional[Sequence[Optional["Header"]]],
+        variances: Optional[ArrayLike],
+        variance_type: Optional[int],
+    ) -> List["Temperature"]:
+        """Builds the instances of a batch from an array of values already in Kelvin."""
+        if values_in_kelvin.ndim != 1:
+            raise ValueError(
+                f"The input values must be a one-dimensional array. Got shape {values_in_kelvin.shape}."
+            )
+
+        size = values_in_kelvin.shape[0]
+        headers = _validate_batch_headers(headers, size)
+
+        if variances is None:
+            variances_list = [None] * size
+        else:
+            variances_arr = np.asarray(variances, dtype=np.float64)
+            if variances_arr.shape != (size,):
+                raise ValueError(
+                    f"Expected {size} variances, one per sample. Got shape {variances_arr.shape}."
+                )
+            variances_list = variances_arr.tolist()
+
+        if variance_type is not None:
+            if isinstance(variance_type, bool) or not isinstance(
+                variance_type, (int, np.integer)
+            ):
+                raise ValueError(
+                    f"The variance_type must be an integer. Got {variance_type!r}."
+                )
+            variance_type = int(variance_type)
+
+        # Values are plain floats converted in bulk and the headers are validated
+        # above: no per-instance validation needed
+        return [
+            cls.model_construct(
+                value=value,
+                header=header,
+                variance=variance,
+                variance_type=variance_type,
+            )
+            for value, header, variance in zip(
+                values_in_kelvin.tolist(), headers, variances_list
+            )
+        ]
+
     def to_celsius(self) -> float:
         """
         Converts and returns the `Temperature` value in Celsius using the formula
@@ -1,4 +1,7 @@
-from .adapter_base import ROSAdapterBase as ROSAdapterBase
+from .adapter_base import (
+    ROSAdapterBase as ROSAdapterBase,
+    ROSTranslationError as ROSTranslationError,
+)
 from .registry import ROSTypeRegistry as ROSTypeRegistry
 from .ros_bridge import ROSBridge as ROSBridge, register_adapter as register_adapter
 from .ros_message import ROSMessage as ROSMessage, ROSHeader as ROSHeader
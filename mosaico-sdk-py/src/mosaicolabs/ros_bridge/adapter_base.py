@@ -1,5 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, Tuple, Type, Any, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from mosaicolabs.models.message import Message
 
@@ -9,6 +20,15 @@ from ..models import Serializable
 T = TypeVar("T", bound=Serializable)
 
 
+class ROSTranslationError(Exception):
+    """Raised when a ROS message cannot be translated into a Mosaico Message."""
+
+    def __init__(self, topic: str, cause: Exception):
+        super().__init__(f"Translation failed for {topic}: {cause}")
+        self.topic = topic
+        self.cause = cause
+
+
 class ROSAdapterBase(ABC, Generic[T]):
     """
     Abstract Base Class for converting ROS messages to Mosaico Ontology types.
@@ -29,6 +49,17 @@ class ROSAdapterBase(ABC, Generic[T]):
     _REQUIRED_KEYS: Tuple[str, ...]
     _REQUIRED_KEYS_CASE_INSENSITIVE: Tuple[str, ...] = ()
 
+    # Frozen copy of `_REQUIRED_KEYS`, computed once per adapter class, used for
+    # the single (C-level) superset check on the incoming ROS dictionaries.
+    # No default: an adapter without `_REQUIRED_KEYS` must not validate as empty
+    _REQUIRED_KEYS_SET: ClassVar[FrozenSet[str]]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # Adapters declaring `_REQUIRED_KEYS` later on get the set on first use
+        if hasattr(cls, "_REQUIRED_KEYS"):
+            cls._REQUIRED_KEYS_SET = frozenset(cls._REQUIRED_KEYS)
+
     @classmethod
     @abstractmethod
     def ros_msg_type(cls) -> str | Tuple[str, ...]:
@@ -49,20 +80,78 @@ class ROSAdapterBase(ABC, Generic[T]):
 
         Returns:
             A Mosaico Message object containing the instantiated ontology data.
+
+        Raises:
+            ROSTranslationError: If the message payload cannot be translated.
         """
         if ros_msg.data is None:
             raise Exception(f"'data' attribute is None for topic {ros_msg.topic}")
 
         try:
             return Message(
-                timestamp_ns=ros_msg.header.translate().stamp.to_nanoseconds()
+                timestamp_ns=ros_msg.header.stamp.to_nanoseconds()
                 if ros_msg.header
                 else ros_msg.bag_timestamp_ns,
                 data=cls.from_dict(ros_msg.data),
                 recording_timestamp_ns=ros_msg.bag_timestamp_ns,
             )
         except Exception as e:
-            raise Exception(f"Translation failed for {ros_msg.topic}: {e}")
+            raise ROSTranslationError(ros_msg.topic, e) from e
+
+    @classmethod
+    def translate_batch(
+        cls, ros_msgs: Sequence[ROSMessage], **kwargs: Any
+    ) -> List[Message]:
+        """
+        Translates a batch of ROS message instances into Mosaico Messages.
+
+        The ontology payloads are built with a single call to `from_dicts`, so
+        adapters able to convert a whole batch at once (e.g. via NumPy) can
+        override it. Once checked to be one `Serializable` per message, the
+        envelopes are created with `Message.model_construct`, skipping the
+        re-validation of the already built payloads.
+
+        Args:
+            ros_msgs: The source containers yielded by the ROSLoader, usually
+                belonging to the same topic.
+            **kwargs: Contextual data such as calibration parameters or frame overrides.
+
+        Returns:
+            The Mosaico Message objects, in the same order as `ros_msgs`.
+
+        Raises:
+            ROSTranslationError: If any message payload of the batch cannot be translated.
+        """
+        for ros_msg in ros_msgs:
+            if ros_msg.data is None:
+                raise Exception(f"'data' attribute is None for topic {ros_msg.topic}")
+
+        try:
+            ontology_objs = cls.from_dicts([ros_msg.data for ros_msg in ros_msgs])
+            # The envelopes skip the validation of `data` that Message(...) runs:
+            # check here what a `from_dicts` override returns
+            if len(ontology_objs) != len(ros_msgs):
+                raise ValueError(
+                    f"'{cls.__name__}.from_dicts' returned {len(ontology_objs)} objects for {len(ros_msgs)} messages"
+                )
+            for ontology_obj in ontology_objs:
+                if not isinstance(ontology_obj, Serializable):
+                    raise TypeError(
+                        f"'{cls.__name__}.from_dicts' must return 'Serializable' instances, found '{type(ontology_obj).__name__}'"
+                    )
+            return [
+                Message.model_construct(
+                    timestamp_ns=ros_msg.header.stamp.to_nanoseconds()
+                    if ros_msg.header
+                    else ros_msg.bag_timestamp_ns,
+                    data=ontology_obj,
+                    recording_timestamp_ns=ros_msg.bag_timestamp_ns,
+                )
+                for ros_msg, ontology_obj in zip(ros_msgs, ontology_objs)
+            ]
+        except Exception as e:
+            topics = sorted({ros_msg.topic for ros_msg in ros_msgs})
+            raise ROSTranslationError(", ".join(topics), e) from e
 
     @classmethod
     @abstractmethod
@@ -74,6 +163,16 @@ class ROSAdapterBase(ABC, Generic[T]):
         """
         pass
 
+    @classmethod
+    def from_dicts(cls, ros_data_list: Sequence[dict]) -> List["Serializable"]:
+        """
+        Maps a batch of raw ROS dictionaries to the corresponding Pydantic models.
+
+        The default implementation calls `from_dict` on each item; adapters can
+        override it with a vectorized conversion of the whole batch.
+        """
+        return [cls.from_dict(ros_data) for ros_data in ros_data_list]
+
     @classmethod
     @abstractmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -2,7 +2,7 @@
 Geometry Messages Adaptation Module.
 
 This module provides specialized adapters for translating ROS `geometry_msgs` into the
-standardized Mosaico Ontology. It implements recursive unwrapping to handle common
+standardized Mosaico Ontology. It iteratively unwraps the nested levels of common
 ROS patterns, such as "Stamped" envelopes and covariance wrappers, ensuring that
 spatial data is normalized before ingestion.
 """
@@ -18,13 +18,11 @@ from mosaicolabs.models.data import (
     Acceleration,
     Velocity,
 )
-from mosaicolabs.models import Message
 
 from ..adapter_base import ROSAdapterBase
-from ..ros_message import ROSMessage
 from ..ros_bridge import register_adapter
 
-from .helpers import _make_header, _validate_msgdata
+from .helpers import _attach_wrapper_metadata, _unwrap_msgdata, _validate_msgdata
 
 
 @register_adapter
@@ -43,10 +41,12 @@ class PoseAdapter(ROSAdapterBase[Pose]):
     - [`geometry_msgs/msg/PoseWithCovariance`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/PoseWithCovariance.html)
     - [`geometry_msgs/msg/PoseWithCovarianceStamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/PoseWithCovarianceStamped.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'pose'` keys. If found (as in `PoseStamped`),
-    it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'pose'` keys. While found (as in `PoseStamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers and covariance matrices found in the wrapper levels.
+    An outer level only overrides the fields it carries: the covariance of
+    `PoseWithCovarianceStamped` is kept from its inner `PoseWithCovariance` level.
 
     Example:
         ```python
@@ -77,38 +77,22 @@ class PoseAdapter(ROSAdapterBase[Pose]):
 
     __mosaico_ontology_type__: Type[Pose] = Pose
     _REQUIRED_KEYS = ("position", "orientation")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Main entry point for translating a high-level `ROSMessage`.
-
-        Args:
-            ros_msg: The source ROS message yielded by the loader.
-            **kwargs: Additional context for the translation.
-
-        Returns:
-            A Mosaico `Message` containing the normalized `Pose` payload.
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "pose"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> Pose:
         """
-        Recursively parses a dictionary to extract a `Pose` object.
+        Parses a dictionary to extract a `Pose` object.
 
         Strategy:
 
-        -  **Recurse**: If a 'pose' key is found, dive deeper into the structure.
+        -  **Unwrap**: While a 'pose' key is found, descend into the nested structure.
         -  **Leaf Node**: At the base level, map 'position' and 'orientation' to
            [`Point3d`][mosaicolabs.models.data.Point3d] and
            [`Quaternion`][mosaicolabs.models.data.Quaternion].
-        -  **Metadata Binding**: Headers and covariances are attached during
-           recursion unwinding.
+        -  **Metadata Binding**: Headers and covariances are attached from
+           the innermost to the outermost wrapper: a level without them keeps
+           the ones found in the inner levels.
 
         Example:
             ```python
@@ -131,34 +115,19 @@ class PoseAdapter(ROSAdapterBase[Pose]):
             Pose: The constructed Mosaico Pose object.
 
         Raises:
-            ValueError: If the recursive 'pose' key exists but is not a dict, or if required keys are missing.
+            ValueError: If a nested 'pose' key exists but is not a dict, or if required keys are missing.
         """
-        out_pose: Optional[Pose] = None
-
-        # Recursive Step: Unwrap nested types (PoseWithCovariance, PoseStamped, PoseWithCovarianceStamped)
-        # Look for a 'pose' key which indicates a wrapper structure
-        pose_dict = ros_data.get("pose")
-        if pose_dict:
-            if not isinstance(pose_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'pose' value in ros message: expected 'dict' found '{type(pose_dict).__name__}'"
-                )
-
-            # Recurse to process the inner dictionary
-            out_pose = cls.from_dict(pose_dict)
-
-            # While unwinding recursion, attach metadata found at this level
-            out_pose.header = _make_header(ros_data.get("header"))
-            out_pose.covariance = ros_data.get("covariance")
-            return out_pose
-
-        # Base Case: We are at the leaf node (no nested 'pose' key)
-        if not out_pose:
-            _validate_msgdata(cls, ros_data)
-            return Pose(
-                position=PointAdapter.from_dict(ros_data["position"]),
-                orientation=QuaternionAdapter.from_dict(ros_data["orientation"]),
-            )
+        # Descend the wrappers (e.g. Stamped, WithCovariance) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
+
+        _validate_msgdata(cls, leaf_dict)
+        out_pose = Pose(
+            position=PointAdapter.from_dict(leaf_dict["position"]),
+            orientation=QuaternionAdapter.from_dict(leaf_dict["orientation"]),
+        )
+
+        _attach_wrapper_metadata(out_pose, wrappers, covariance=True)
+        return out_pose
 
 
 @register_adapter
@@ -176,10 +145,12 @@ class TwistAdapter(ROSAdapterBase[Velocity]):
     - [`geometry_msgs/msg/TwistWithCovariance`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/TwistWithCovariance.html)
     - [`geometry_msgs/msg/TwistWithCovarianceStamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/TwistWithCovarianceStamped.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'twist'` keys. If found (as in `TwistStamped`),
-    it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'twist'` keys. While found (as in `TwistStamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers and covariance matrices found in the wrapper levels.
+    An outer level only overrides the fields it carries: the covariance of
+    `TwistWithCovarianceStamped` is kept from its inner `TwistWithCovariance` level.
 
     Example:
         ```python
@@ -210,35 +181,20 @@ class TwistAdapter(ROSAdapterBase[Velocity]):
 
     __mosaico_ontology_type__: Type[Velocity] = Velocity
     _REQUIRED_KEYS = ("linear", "angular")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `Velocity` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "twist"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> Velocity:
         """
-        Recursively parses the ROS data dictionary to extract a `Velocity` (Twist).
+        Parses the ROS data dictionary to extract a `Velocity` (Twist).
 
         Strategy:
-        -  **Recurse**: If a 'twist' key is found, dive deeper into the structure.
+        -  **Unwrap**: While a 'twist' key is found, descend into the nested structure.
         -  **Leaf Node**: At the base level, map 'linear' and 'angular' to
            [`Vector3`][mosaicolabs.models.data.geometry.Vector3d].
-        -  **Metadata Binding**: Headers and covariances are attached during
-           recursion unwinding.
+        -  **Metadata Binding**: Headers and covariances are attached from
+           the innermost to the outermost wrapper: a level without them keeps
+           the ones found in the inner levels.
 
         Example:
             ```python
@@ -262,33 +218,19 @@ class TwistAdapter(ROSAdapterBase[Velocity]):
             Velocity: The constructed Mosaico Velocity object.
 
         Raises:
-            ValueError: If the recursive 'twist' key exists but is not a dict, or if required keys are missing.
+            ValueError: If a nested 'twist' key exists but is not a dict, or if required keys are missing.
         """
-        out_twist: Optional[Velocity] = None
-
-        # Recursive Step: Unwrap nested types
-        twist_dict = ros_data.get("twist")
-        if twist_dict:
-            if not isinstance(twist_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'twist' value in ros message: expected 'dict' found '{type(twist_dict).__name__}'"
-                )
-
-            out_twist = cls.from_dict(twist_dict)
+        # Descend the wrappers (e.g. Stamped, WithCovariance) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
 
-            # Apply metadata from wrapper levels
-            out_twist.header = _make_header(ros_data.get("header"))
-            out_twist.covariance = ros_data.get("covariance")
-            return out_twist
-
-        # Base Case: Leaf node
-        if not out_twist:
-            _validate_msgdata(cls, ros_data)
+        _validate_msgdata(cls, leaf_dict)
+        out_twist = Velocity(
+            linear=Vector3Adapter.from_dict(leaf_dict["linear"]),
+            angular=Vector3Adapter.from_dict(leaf_dict["angular"]),
+        )
 
-            return Velocity(
-                linear=Vector3Adapter.from_dict(ros_data["linear"]),
-                angular=Vector3Adapter.from_dict(ros_data["angular"]),
-            )
+        _attach_wrapper_metadata(out_twist, wrappers, covariance=True)
+        return out_twist
 
     @classmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -307,9 +249,12 @@ class AccelAdapter(ROSAdapterBase[Acceleration]):
     - [`geometry_msgs/msg/AccelWithCovariance`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/AccelWithCovariance.html)
     - [`geometry_msgs/msg/AccelWithCovarianceStamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/AccelWithCovarianceStamped.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'accel'` keys. If found (as in `AccelStamped`), it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'accel'` keys. While found (as in `AccelStamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers and covariance matrices found in the wrapper levels.
+    An outer level only overrides the fields it carries: the covariance of
+    `AccelWithCovarianceStamped` is kept from its inner `AccelWithCovariance` level.
 
     Example:
         ```python
@@ -340,35 +285,20 @@ class AccelAdapter(ROSAdapterBase[Acceleration]):
 
     __mosaico_ontology_type__: Type[Acceleration] = Acceleration
     _REQUIRED_KEYS = ("linear", "angular")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `Acceleration` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "accel"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> Acceleration:
         """
-        Recursively parses the ROS data dictionary to extract an `Acceleration`.
+        Parses the ROS data dictionary to extract an `Acceleration`.
 
         Strategy:
-        -  **Recurse**: If a 'accel' key is found, dive deeper into the structure.
+        -  **Unwrap**: While a 'accel' key is found, descend into the nested structure.
         -  **Leaf Node**: At the base level, map 'linear' and 'angular' to
            [`Vector3`][mosaicolabs.models.data.geometry.Vector3d].
-        -  **Metadata Binding**: Headers and covariances are attached during
-           recursion unwinding.
+        -  **Metadata Binding**: Headers and covariances are attached from
+           the innermost to the outermost wrapper: a level without them keeps
+           the ones found in the inner levels.
 
         Example:
             ```python
@@ -392,33 +322,19 @@ class AccelAdapter(ROSAdapterBase[Acceleration]):
             Acceleration: The constructed Mosaico Acceleration object.
 
         Raises:
-            ValueError: If the recursive 'accel' key exists but is not a dict, or if required keys are missing.
+            ValueError: If a nested 'accel' key exists but is not a dict, or if required keys are missing.
         """
-        out_accel: Optional[Acceleration] = None
-
-        # Recursive Step: Unwrap nested types
-        accel_dict = ros_data.get("accel")
-        if accel_dict:
-            if not isinstance(accel_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'accel' value in ros message: expected 'dict' found '{type(accel_dict).__name__}'"
-                )
+        # Descend the wrappers (e.g. Stamped, WithCovariance) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
 
-            out_accel = cls.from_dict(accel_dict)
-
-            # Apply metadata from wrapper levels
-            out_accel.header = _make_header(ros_data.get("header"))
-            out_accel.covariance = ros_data.get("covariance")
-            return out_accel
-
-        # Base Case: Leaf node
-        if not out_accel:
-            _validate_msgdata(cls, ros_data)
+        _validate_msgdata(cls, leaf_dict)
+        out_accel = Acceleration(
+            linear=Vector3Adapter.from_dict(leaf_dict["linear"]),
+            angular=Vector3Adapter.from_dict(leaf_dict["angular"]),
+        )
 
-            return Acceleration(
-                linear=Vector3Adapter.from_dict(ros_data["linear"]),
-                angular=Vector3Adapter.from_dict(ros_data["angular"]),
-            )
+        _attach_wrapper_metadata(out_accel, wrappers, covariance=True)
+        return out_accel
 
     @classmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -435,9 +351,10 @@ class Vector3Adapter(ROSAdapterBase[Vector3d]):
     - [`geometry_msgs/msg/Vector3`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/Vector3.html)
     - [`geometry_msgs/msg/Vector3Stamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/Vector3Stamped.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'vector'` keys. If found (as in `Vector3Stamped`), it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'vector'` keys. While found (as in `Vector3Stamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers found in the wrapper levels.
 
     Example:
         ```python
@@ -462,35 +379,19 @@ class Vector3Adapter(ROSAdapterBase[Vector3d]):
 
     __mosaico_ontology_type__: Type[Vector3d] = Vector3d
     _REQUIRED_KEYS = ("x", "y", "z")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `Vector3d` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "vector"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> Vector3d:
         """
-        Recursively parses the ROS data to extract a `Vector3d`.
+        Parses the ROS data to extract a `Vector3d`.
 
         Strategy:
-        -  **Recurse**: If a 'vector' key is found, dive deeper into the structure.
+        -  **Unwrap**: While a 'vector' key is found, descend into the nested structure.
         -  **Leaf Node**: At the base level, map 'x', 'y' and 'z' to
            [`Vector3d`][mosaicolabs.models.data.Vector3d].
-        -  **Metadata Binding**: Headers and covariances are attached during
-           recursion unwinding.
+        -  **Metadata Binding**: Headers are attached from the innermost to the
+           outermost wrapper.
 
         Example:
             ```python
@@ -510,32 +411,20 @@ class Vector3Adapter(ROSAdapterBase[Vector3d]):
             Vector3d: The constructed Mosaico Vector3d object.
 
         Raises:
-            ValueError: If the recursive 'vector' key exists but is not a dict, or if required keys are missing.
+            ValueError: If a nested 'vector' key exists but is not a dict, or if required keys are missing.
         """
-        out_vec3: Optional[Vector3d] = None
-
-        # Recursive Step: Unwrap nested types (Vector3dStamped usually has 'vector')
-        vec3_dict = ros_data.get("vector")
-        if vec3_dict:
-            if not isinstance(vec3_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'vector' value in ros message: expected 'dict' found '{type(vec3_dict).__name__}'"
-                )
-
-            out_vec3 = cls.from_dict(vec3_dict)
-
-            # Apply metadata
-            out_vec3.header = _make_header(ros_data.get("header"))
-            return out_vec3
-
-        # Base Case: Leaf node
-        if not out_vec3:
-            _validate_msgdata(cls, ros_data)
-            return Vector3d(
-                x=ros_data["x"],
-                y=ros_data["y"],
-                z=ros_data["z"],
-            )
+        # Descend the wrappers (e.g. Stamped, WithCovariance) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
+
+        _validate_msgdata(cls, leaf_dict)
+        out_vec3 = Vector3d(
+            x=leaf_dict["x"],
+            y=leaf_dict["y"],
+            z=leaf_dict["z"],
+        )
+
+        _attach_wrapper_metadata(out_vec3, wrappers)
+        return out_vec3
 
     @classmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -552,9 +441,10 @@ class PointAdapter(ROSAdapterBase[Point3d]):
     - [`geometry_msgs/msg/Point`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/Point.html)
     - [`geometry_msgs/msg/PointStamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/PointStamped.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'point'` keys. If found (as in `PointStamped`), it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'point'` keys. While found (as in `PointStamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers found in the wrapper levels.
 
     Example:
         ```python
@@ -579,35 +469,19 @@ class PointAdapter(ROSAdapterBase[Point3d]):
 
     __mosaico_ontology_type__: Type[Point3d] = Point3d
     _REQUIRED_KEYS = ("x", "y", "z")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `Point3d` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "point"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> Point3d:
         """
-        Recursively parses the ROS data to extract a `Point3d`.
+        Parses the ROS data to extract a `Point3d`.
 
         Strategy:
-            -  **Recurse**: If a 'point' key is found, dive deeper into the structure.
+            -  **Unwrap**: While a 'point' key is found, descend into the nested structure.
             -  **Leaf Node**: At the base level, map 'x', 'y' and 'z' to
                [`Point3d`][mosaicolabs.models.data.Point3d].
-            -  **Metadata Binding**: Headers and covariances are attached during
-               recursion unwinding.
+            -  **Metadata Binding**: Headers are attached from the innermost to the
+               outermost wrapper.
 
         Example:
             ```python
@@ -627,32 +501,20 @@ class PointAdapter(ROSAdapterBase[Point3d]):
             Point3d: The constructed Mosaico Point3d object.
 
         Raises:
-            ValueError: If the recursive 'point' key exists but is not a dict, or if required keys are missing.
+            ValueError: If a nested 'point' key exists but is not a dict, or if required keys are missing.
         """
-        out_point: Optional[Point3d] = None
-
-        # Recursive Step: Unwrap nested types (PointStamped uses 'point')
-        point_dict = ros_data.get("point")
-        if point_dict:
-            if not isinstance(point_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'point' value in ros message: expected 'dict' found '{type(point_dict).__name__}'"
-                )
-
-            out_point = cls.from_dict(point_dict)
-
-            # Apply metadata
-            out_point.header = _make_header(ros_data.get("header"))
-            return out_point
-
-        # Base Case: Leaf node
-        if not out_point:
-            _validate_msgdata(cls, ros_data)
-            return Point3d(
-                x=ros_data["x"],
-                y=ros_data["y"],
-                z=ros_data["z"],
-            )
+        # Descend the wrappers (e.g. Stamped, WithCovariance) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
+
+        _validate_msgdata(cls, leaf_dict)
+        out_point = Point3d(
+            x=leaf_dict["x"],
+            y=leaf_dict["y"],
+            z=leaf_dict["z"],
+        )
+
+        _attach_wrapper_metadata(out_point, wrappers)
+        return out_point
 
     @classmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -669,9 +531,10 @@ class QuaternionAdapter(ROSAdapterBase[Quaternion]):
     - [`geometry_msgs/msg/Quaternion`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/Quaternion.html)
     - [`geometry_msgs/msg/QuaternionStamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/QuaternionStamped.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'quaternion'` keys. If found (as in `QuaternionStamped`), it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'quaternion'` keys. While found (as in `QuaternionStamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers found in the wrapper levels.
 
     Example:
         ```python
@@ -696,35 +559,19 @@ class QuaternionAdapter(ROSAdapterBase[Quaternion]):
 
     __mosaico_ontology_type__: Type[Quaternion] = Quaternion
     _REQUIRED_KEYS = ("x", "y", "z", "w")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `Quaternion` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "quaternion"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> Quaternion:
         """
-        Recursively parses the ROS data to extract a `Quaternion`.
+        Parses the ROS data to extract a `Quaternion`.
 
         Strategy:
-            -  **Recurse**: If a 'quaternion' key is found, dive deeper into the structure.
+            -  **Unwrap**: While a 'quaternion' key is found, descend into the nested structure.
             -  **Leaf Node**: At the base level, map 'x', 'y', 'z' and 'w' to
                [`Quaternion`][mosaicolabs.models.data.Quaternion].
-            -  **Metadata Binding**: Headers and covariances are attached during
-               recursion unwinding.
+            -  **Metadata Binding**: Headers are attached from the innermost to the
+               outermost wrapper.
 
         Example:
             ```python
@@ -744,33 +591,21 @@ class QuaternionAdapter(ROSAdapterBase[Quaternion]):
             Quaternion: The constructed Mosaico Quaternion object.
 
         Raises:
-            ValueError: If the recursive 'quaternion' key exists but is not a dict, or if required keys are missing.
+            ValueError: If a nested 'quaternion' key exists but is not a dict, or if required keys are missing.
         """
-        out_quat: Optional[Quaternion] = None
-
-        # Recursive Step: Unwrap nested types (QuaternionStamped uses 'quaternion')
-        quat_dict = ros_data.get("quaternion")
-        if quat_dict:
-            if not isinstance(quat_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'quaternion' value in ros message: expected 'dict' found '{type(quat_dict).__name__}'"
-                )
-
-            out_quat = cls.from_dict(quat_dict)
-
-            # Apply metadata
-            out_quat.header = _make_header(ros_data.get("header"))
-            return out_quat
-
-        # Base Case: Leaf node
-        if not out_quat:
-            _validate_msgdata(cls, ros_data)
-            return Quaternion(
-                x=ros_data["x"],
-                y=ros_data["y"],
-                z=ros_data["z"],
-                w=ros_data["w"],
-            )
+        # Descend the wrappers (e.g. Stamped, WithCovariance) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
+
+        _validate_msgdata(cls, leaf_dict)
+        out_quat = Quaternion(
+            x=leaf_dict["x"],
+            y=leaf_dict["y"],
+            z=leaf_dict["z"],
+            w=leaf_dict["w"],
+        )
+
+        _attach_wrapper_metadata(out_quat, wrappers)
+        return out_quat
 
     @classmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -787,9 +622,10 @@ class TransformAdapter(ROSAdapterBase[Transform]):
     - [`geometry_msgs/msg/TransformStamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/TransformStamped.html)
     - [`geometry_msgs/msg/Transform`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/Transform.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'transform'` keys. If found (as in `TransformStamped`), it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'transform'` keys. While found (as in `TransformStamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers and child frame ids found in the wrapper levels.
 
     Example:
         ```python
@@ -814,23 +650,7 @@ class TransformAdapter(ROSAdapterBase[Transform]):
 
     __mosaico_ontology_type__: Type[Transform] = Transform
     _REQUIRED_KEYS = ("translation", "rotation")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `Transform` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "transform"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> Transform:
@@ -839,11 +659,11 @@ class TransformAdapter(ROSAdapterBase[Transform]):
         and flat structure.
 
         Strategy:
-            -  **Recurse**: If a 'transform' key is found, dive deeper into the structure.
+            -  **Unwrap**: While a 'transform' key is found, descend into the nested structure.
             -  **Leaf Node**: At the base level, map 'translation' and 'rotation' to
                [`Transform`][mosaicolabs.models.data.Transform].
-            -  **Metadata Binding**: Headers and covariances are attached during
-               recursion unwinding.
+            -  **Metadata Binding**: Headers and child frame ids are attached from
+               the innermost to the outermost wrapper.
 
         Example:
             ```python
@@ -863,33 +683,19 @@ class TransformAdapter(ROSAdapterBase[Transform]):
             Transform: The constructed Mosaico Transform object.
 
         Raises:
-            ValueError: If the recursive 'transform' key exists but is not a dict, or if required keys are missing.
+            ValueError: If a nested 'transform' key exists but is not a dict, or if required keys are missing.
         """
-        out_transf: Optional[Transform] = None
-
-        # Recursive Step: Unwrap nested types (TransformStamped)
-        transf_dict = ros_data.get("transform")
-        if transf_dict:
-            if not isinstance(transf_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'transform' value in ros message: expected 'dict' found '{type(transf_dict).__name__}'"
-                )
-
-            out_transf = cls.from_dict(transf_dict)
+        # Descend the wrapper (e.g. TransformStamped) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
 
-            # Apply metadata
-            out_transf.header = _make_header(ros_data.get("header"))
-            out_transf.target_frame_id = ros_data.get("child_frame_id")
-            return out_transf
-
-        # Base Case: Leaf node
-        if not out_transf:
-            _validate_msgdata(cls, ros_data)
+        _validate_msgdata(cls, leaf_dict)
+        out_transf = Transform(
+            translation=Vector3Adapter.from_dict(leaf_dict["translation"]),
+            rotation=QuaternionAdapter.from_dict(leaf_dict["rotation"]),
+        )
 
-            return Transform(
-                translation=Vector3Adapter.from_dict(ros_data["translation"]),
-                rotation=QuaternionAdapter.from_dict(ros_data["rotation"]),
-            )
+        _attach_wrapper_metadata(out_transf, wrappers, child_frame_id=True)
+        return out_transf
 
     @classmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -906,9 +712,10 @@ class WrenchAdapter(ROSAdapterBase[ForceTorque]):
     - [`geometry_msgs/msg/Wrench`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/Wrench.html)
     - [`geometry_msgs/msg/WrenchStamped`](https://docs.ros2.org/foxy/api/geometry_msgs/msg/WrenchStamped.html)
 
-    **Recursive Unwrapping Strategy:**
-    The adapter checks for nested `'wrench'` keys. If found (as in `WrenchStamped`), it recurses to the leaf node while collecting metadata like headers and
-    covariance matrices along the way.
+    **Iterative Unwrapping Strategy:**
+    The adapter checks for nested `'wrench'` keys. While found (as in `WrenchStamped`),
+    it descends one level at a time down to the leaf node, then attaches the
+    headers found in the wrapper levels.
 
     Example:
         ```python
@@ -933,23 +740,7 @@ class WrenchAdapter(ROSAdapterBase[ForceTorque]):
 
     __mosaico_ontology_type__: Type[ForceTorque] = ForceTorque
     _REQUIRED_KEYS = ("force", "torque")
-
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `ForceTorque` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
+    _WRAPPER_KEY = "wrench"
 
     @classmethod
     def from_dict(cls, ros_data: dict) -> ForceTorque:
@@ -958,11 +749,11 @@ class WrenchAdapter(ROSAdapterBase[ForceTorque]):
         and flat structure.
 
         Strategy:
-            -  **Recurse**: If a 'wrench' key is found, dive deeper into the structure.
+            -  **Unwrap**: While a 'wrench' key is found, descend into the nested structure.
             -  **Leaf Node**: At the base level, map 'force' and 'torque' to
                [`ForceTorque`][mosaicolabs.models.data.ForceTorque].
-            -  **Metadata Binding**: Headers and covariances are attached during
-               recursion unwinding.
+            -  **Metadata Binding**: Headers are attached from the innermost to the
+               outermost wrapper.
 
         Example:
             ```python
@@ -975,30 +766,17 @@ class WrenchAdapter(ROSAdapterBase[ForceTorque]):
             mosaico_wrench = WrenchAdapter.from_dict(ros_data)
             ```
         """
-        out_ft: Optional[ForceTorque] = None
-
-        # Recursive Step: Unwrap nested types (TransformStamped)
-        wrench_dict = ros_data.get("wrench")
-        if wrench_dict:
-            if not isinstance(wrench_dict, dict):
-                raise ValueError(
-                    f"Invalid type for 'wrench' value in ros message: expected 'dict' found '{type(wrench_dict).__name__}'"
-                )
-
-            out_ft = cls.from_dict(wrench_dict)
-
-            # Apply metadata
-            out_ft.header = _make_header(ros_data.get("header"))
-            return out_ft
-
-        # Base Case: Leaf node
-        if not out_ft:
-            _validate_msgdata(cls, ros_data)
-
-            return ForceTorque(
-                force=Vector3Adapter.from_dict(ros_data["force"]),
-                torque=Vector3Adapter.from_dict(ros_data["torque"]),
-            )
+        # Descend the wrapper (e.g. WrenchStamped) down to the leaf node
+        leaf_dict, wrappers = _unwrap_msgdata(ros_data, cls._WRAPPER_KEY)
+
+        _validate_msgdata(cls, leaf_dict)
+        out_ft = ForceTorque(
+            force=Vector3Adapter.from_dict(leaf_dict["force"]),
+            torque=Vector3Adapter.from_dict(leaf_dict["torque"]),
+        )
+
+        _attach_wrapper_metadata(out_ft, wrappers)
+        return out_ft
 
     @classmethod
     def schema_metadata(cls, ros_data: dict, **kwargs: Any) -> Optional[dict]:
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 from mosaicolabs.models import Header
 
 from ..adapter_base import ROSAdapterBase
@@ -9,22 +9,86 @@ def _make_header(ros_head_dict: Optional[Dict]) -> Optional[Header]:
     # Extract metadata
     if ros_head_dict is None:
         return None
+    # Validated construction: the nested headers (e.g. each TransformStamped of a
+    # TF message) and the direct `from_dict` calls are not checked anywhere else
     return Header(**ros_head_dict)
 
 
+def _get_case_insensitive(ros_data: dict, key: str) -> Any:
+    # Single probe for the (ROS2) exact key; the (ROS1) upper case variant is only
+    # looked up on a miss. Falsy values (e.g. an empty list) are valid matches
+    value = ros_data.get(key)
+    if value is None:
+        value = ros_data.get(key.upper())
+    return value
+
+
+def _unwrap_msgdata(ros_data: dict, wrapper_key: str) -> Tuple[dict, List[dict]]:
+    # Iteratively descend the nested wrappers (e.g. 'pose' in PoseStamped) down to
+    # the leaf dictionary. The wrappers are returned from the outermost to the
+    # innermost, to let the caller attach the metadata found at each level
+    wrappers: List[dict] = []
+    node = ros_data
+    while (inner := node.get(wrapper_key)) is not None:
+        if type(inner) is not dict:
+            raise ValueError(
+                f"Invalid type for '{wrapper_key}' value in ros message: expected 'dict' found '{type(inner).__name__}'"
+            )
+        wrappers.append(node)
+        node = inner
+    return node, wrappers
+
+
+def _attach_wrapper_metadata(
+    obj: Any,
+    wrappers: List[dict],
+    covariance: bool = False,
+    child_frame_id: bool = False,
+) -> None:
+    # Attach the metadata of the wrappers returned by `_unwrap_msgdata`. Walking
+    # from the innermost to the outermost level, a level without a field does not
+    # clear the one found below it (e.g. the covariance of PoseWithCovariance
+    # survives the outer PoseWithCovarianceStamped level)
+    header = cov = frame_id = None
+    for wrapper in reversed(wrappers):
+        if (value := wrapper.get("header")) is not None:
+            header = value
+        if covariance and (value := wrapper.get("covariance")) is not None:
+            cov = value
+        if child_frame_id and (value := wrapper.get("child_frame_id")) is not None:
+            frame_id = value
+
+    # The header is only built for the level that is kept
+    if header is not None:
+        obj.header = _make_header(header)
+    if cov is not None:
+        obj.covariance = cov
+    if frame_id is not None:
+        obj.target_frame_id = frame_id
+
+
 def _validate_msgdata(
     cls: Type[ROSAdapterBase], ros_data: dict, case_insensitive: bool = False
 ):
+    try:
+        required_keys = cls._REQUIRED_KEYS_SET
+    except AttributeError:
+        # `_REQUIRED_KEYS` assigned after the class creation (raises, as expected,
+        # if it is not declared at all)
+        required_keys = cls._REQUIRED_KEYS_SET = frozenset(cls._REQUIRED_KEYS)
+
+    # Fast path: all the required keys are present with their exact name
+    if ros_data.keys() >= required_keys:
+        return
+
+    # Slow path, only reached on a miss: collect the missing keys for the error
     missing_keys = [
         key
         for key in cls._REQUIRED_KEYS
-        if key not in ros_data.keys()
+        if key not in ros_data
         and (
             not case_insensitive
-            or (
-                key.lower() not in ros_data.keys()
-                and key.upper() not in ros_data.keys()
-            )
+            or (key.lower() not in ros_data and key.upper() not in ros_data)
         )
     ]
 
@@ -1,11 +1,9 @@
 from typing import Any, Optional, Tuple, Type
 
 from mosaicolabs.models.data import MotionState
-from mosaicolabs.models import Message
 
 from .geometry_msgs import PoseAdapter, TwistAdapter
 from ..adapter_base import ROSAdapterBase
-from ..ros_message import ROSMessage
 from ..ros_bridge import register_adapter
 
 from .helpers import _make_header, _validate_msgdata
@@ -50,23 +48,6 @@ class OdometryAdapter(ROSAdapterBase[MotionState]):
     __mosaico_ontology_type__: Type[MotionState] = MotionState
     _REQUIRED_KEYS = ("pose", "twist", "child_frame_id")
 
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `MotionState` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> MotionState:
         """
@@ -1,6 +1,5 @@
 from typing import Any, List, Optional, Tuple, Type
 from mosaicolabs.models.data import Point3d, Vector2d, ROI
-from mosaicolabs.models import Message
 from mosaicolabs.models.sensors import (
     CameraInfo,
     GPS,
@@ -17,11 +16,10 @@ from .geometry_msgs import (
     Vector3Adapter,
 )
 from ..data_ontology import BatteryState
-from ..ros_message import ROSMessage
 from ..adapter_base import ROSAdapterBase
 from ..ros_bridge import register_adapter
 
-from .helpers import _make_header, _validate_msgdata
+from .helpers import _get_case_insensitive, _make_header, _validate_msgdata
 
 
 @register_adapter
@@ -80,23 +78,6 @@ class CameraInfoAdapter(ROSAdapterBase[CameraInfo]):
         "r",
     )
 
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `CameraInfo` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> CameraInfo:
         """
@@ -149,10 +130,10 @@ class CameraInfoAdapter(ROSAdapterBase[CameraInfo]):
                 y=ros_data["binning_y"],
             ),
             distortion_model=ros_data["distortion_model"],
-            distortion_parameters=ros_data.get("d") or ros_data.get("D"),
-            intrinsic_parameters=ros_data.get("k") or ros_data.get("K"),
-            projection_parameters=ros_data.get("p") or ros_data.get("P"),
-            rectification_parameters=ros_data.get("r") or ros_data.get("R"),
+            distortion_parameters=_get_case_insensitive(ros_data, "d"),
+            intrinsic_parameters=_get_case_insensitive(ros_data, "k"),
+            projection_parameters=_get_case_insensitive(ros_data, "p"),
+            rectification_parameters=_get_case_insensitive(ros_data, "r"),
             roi=ROIAdapter.from_dict(ros_data["roi"]),
         )
 
@@ -195,19 +176,6 @@ class NavSatStatusAdapter(ROSAdapterBase[GPSStatus]):
     _REQUIRED_KEYS = ("status", "service")
     _SCHEMA_METADATA_KEYS_PREFIX = ("STATUS_", "SERVICE_")
 
-    @classmethod
-    def translate(cls, ros_msg: ROSMessage, **kwargs: Any) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `GPSStatus` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> GPSStatus:
         """
@@ -241,17 +209,12 @@ class NavSatStatusAdapter(ROSAdapterBase[GPSStatus]):
         """
         Extract the ROS message specific schema metadata, if any.
         """
-        schema_mdata = None
-        for schema_mdata_prefix in cls._SCHEMA_METADATA_KEYS_PREFIX:
-            if not schema_mdata:
-                schema_mdata = {}
-            schema_mdata.update(
-                {
-                    key: val
-                    for key, val in ros_data.items()
-                    if key.startswith(schema_mdata_prefix)
-                }
-            )
+        # str.startswith accepts the whole tuple of prefixes: a single pass on the keys
+        schema_mdata = {
+            key: val
+            for key, val in ros_data.items()
+            if key.startswith(cls._SCHEMA_METADATA_KEYS_PREFIX)
+        }
         return schema_mdata if schema_mdata else None
 
 
@@ -292,19 +255,6 @@ class GPSAdapter(ROSAdapterBase[GPS]):
     _REQUIRED_KEYS = ("latitude", "longitude", "altitude", "status")
     _SCHEMA_METADATA_KEYS_PREFIX = ("COVARIANCE_TYPE_",)
 
-    @classmethod
-    def translate(cls, ros_msg: ROSMessage, **kwargs: Any) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `GPS` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> GPS:
         """
@@ -354,15 +304,11 @@ class GPSAdapter(ROSAdapterBase[GPS]):
         """
         Extract the ROS message specific schema metadata, if any.
         """
-        schema_mdata = {}
-        for schema_mdata_prefix in cls._SCHEMA_METADATA_KEYS_PREFIX:
-            schema_mdata.update(
-                {
-                    key: val
-                    for key, val in ros_data.items()
-                    if key.startswith(schema_mdata_prefix)
-                }
-            )
+        schema_mdata = {
+            key: val
+            for key, val in ros_data.items()
+            if key.startswith(cls._SCHEMA_METADATA_KEYS_PREFIX)
+        }
 
         status = ros_data.get("status")
         if status:
@@ -414,9 +360,8 @@ class IMUAdapter(ROSAdapterBase[IMU]):
         # ROS often uses an all-zero matrix (or a matrix with a special marker)
         # to indicate 'no covariance provided'.
         # Assuming all zeros means invalid/unprovided data.
-        if not covariance_list:
-            return False
-        return any(c != 0.0 for c in covariance_list)
+        # any() tests the truthiness of the floats in C, i.e. 'c != 0.0' for each one
+        return covariance_list is not None and any(covariance_list)
 
     @staticmethod
     def _is_data_available(covariance_list: Optional[List[float]]) -> bool:
@@ -427,19 +372,6 @@ class IMUAdapter(ROSAdapterBase[IMU]):
             return False
         return covariance_list[0] != -1
 
-    @classmethod
-    def translate(cls, ros_msg: ROSMessage, **kwargs: Any) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `IMU` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> IMU:
         """
@@ -478,22 +410,23 @@ class IMUAdapter(ROSAdapterBase[IMU]):
         # Optional Field Conversions (Attitude)
         # Check if the orientation is valid
         orientation = None
-        if cls._is_data_available(ros_data.get("orientation_covariance")):
+        ori_covariance = ros_data.get("orientation_covariance")
+        if cls._is_data_available(ori_covariance):
             ori_dict = ros_data.get("orientation")
             orientation = QuaternionAdapter.from_dict(ori_dict) if ori_dict else None
-        if orientation and cls._is_valid_covariance(
-            ros_data.get("orientation_covariance")
-        ):
-            orientation.covariance = ros_data.get("orientation_covariance")
+        if orientation and cls._is_valid_covariance(ori_covariance):
+            orientation.covariance = ori_covariance
 
         # Optional Field Conversions (Covariance)
-        if cls._is_valid_covariance(ros_data.get("linear_acceleration_covariance")):
+        accel_covariance = ros_data.get("linear_acceleration_covariance")
+        if cls._is_valid_covariance(accel_covariance):
             # ROS covariance is a 9-element array (row-major 3x3).
             # Vector9d is assumed to take these 9 elements directly.
-            accel.covariance = ros_data.get("linear_acceleration_covariance")
+            accel.covariance = accel_covariance
 
-        if cls._is_valid_covariance(ros_data.get("angular_velocity_covariance")):
-            angular_vel.covariance = ros_data.get("angular_velocity_covariance")
+        angular_vel_covariance = ros_data.get("angular_velocity_covariance")
+        if cls._is_valid_covariance(angular_vel_covariance):
+            angular_vel.covariance = angular_vel_covariance
 
         return IMU(
             header=_make_header(ros_data.get("header")),
@@ -541,19 +474,6 @@ class NMEASentenceAdapter(ROSAdapterBase[NMEASentence]):
 
     _REQUIRED_KEYS = ("sentence",)
 
-    @classmethod
-    def translate(cls, ros_msg: ROSMessage, **kwargs: Any) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `NMEASenetence` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> NMEASentence:
         """
@@ -624,23 +544,6 @@ class ImageAdapter(ROSAdapterBase[Image]):
 
     _REQUIRED_KEYS = ("data", "width", "height", "step", "encoding")
 
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `Image` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(
         cls,
@@ -723,23 +626,6 @@ class CompressedImageAdapter(ROSAdapterBase[CompressedImage]):
     __mosaico_ontology_type__: Type[CompressedImage] = CompressedImage
     _REQUIRED_KEYS = ("data", "format")
 
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `CompressedImage` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(
         cls,
@@ -815,23 +701,6 @@ class ROIAdapter(ROSAdapterBase[ROI]):
 
     _REQUIRED_KEYS = ("height", "width", "x_offset", "y_offset")
 
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `ROI` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> ROI:
         """
@@ -936,19 +805,6 @@ class BatteryStateAdapter(ROSAdapterBase[BatteryState]):
     )
     _SCHEMA_METADATA_KEYS_PREFIX = ("POWER_SUPPLY_",)
 
-    @classmethod
-    def translate(cls, ros_msg: ROSMessage, **kwargs: Any) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `BatteryState` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> BatteryState:
         """
@@ -1011,15 +867,11 @@ class BatteryStateAdapter(ROSAdapterBase[BatteryState]):
         """
         Extract the ROS message specific schema metadata, if any.
         """
-        schema_mdata = {}
-        for schema_mdata_prefix in cls._SCHEMA_METADATA_KEYS_PREFIX:
-            schema_mdata.update(
-                {
-                    key: val
-                    for key, val in ros_data.items()
-                    if key.startswith(schema_mdata_prefix)
-                }
-            )
+        schema_mdata = {
+            key: val
+            for key, val in ros_data.items()
+            if key.startswith(cls._SCHEMA_METADATA_KEYS_PREFIX)
+        }
 
         status = ros_data.get("status")
         if status:
@@ -1066,23 +918,6 @@ class RobotJointAdapter(ROSAdapterBase[RobotJoint]):
     __mosaico_ontology_type__: Type[RobotJoint] = RobotJoint
     _REQUIRED_KEYS = ("name", "position", "velocity", "effort")
 
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `RobotJoint` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> RobotJoint:
         """
@@ -31,10 +31,9 @@ from mosaicolabs.models.data import (
     Unsigned64,
     Unsigned8,
 )
-from mosaicolabs.models import Message, Serializable
+from mosaicolabs.models import Serializable
 
 from ..adapter_base import ROSAdapterBase
-from ..ros_message import ROSMessage, ROSHeader
 from ..ros_bridge import register_adapter
 from .helpers import _validate_msgdata
 
@@ -140,17 +139,6 @@ class GenericStdAdapter(ROSAdapterBase[Serializable]):
     __mosaico_ontology_type__: Type[Serializable]
     _REQUIRED_KEYS = ("data",)
 
-    @classmethod
-    def translate(cls, ros_msg: ROSMessage, **kwargs: Any) -> Message:
-        """
-        Translates a standard ROS message to a Mosaico Message.
-
-        Standard messages typically contain a 'data' field and metadata.
-        This method extracts the header/timestamp and wraps the payload using
-        the specific ontology type defined for this adapter class.
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> Serializable:
         """
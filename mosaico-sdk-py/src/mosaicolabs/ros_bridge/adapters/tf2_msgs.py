@@ -1,9 +1,7 @@
 from typing import Any, Optional, Tuple, Type
-from mosaicolabs.models import Message
 
 from ..data_ontology import FrameTransform
 from ..adapter_base import ROSAdapterBase
-from ..ros_message import ROSMessage
 from ..ros_bridge import register_adapter
 
 from .geometry_msgs import TransformAdapter
@@ -63,23 +61,6 @@ class FrameTransformAdapter(ROSAdapterBase):
     __mosaico_ontology_type__: Type[FrameTransform] = FrameTransform
     _REQUIRED_KEYS = ("transforms",)
 
-    @classmethod
-    def translate(
-        cls,
-        ros_msg: ROSMessage,  # ROSMessage
-        **kwargs: Any,
-    ) -> Message:
-        """
-        Translates a ROS message into a Mosaico Message.
-
-        Returns:
-            Message: The translated message containing a `FrameTransform` object.
-
-        Raises:
-            Exception: Wraps any translation error with context (topic name, timestamp).
-        """
-        return super().translate(ros_msg, **kwargs)
-
     @classmethod
     def from_dict(cls, ros_data: dict) -> FrameTransform:
         """
@@ -122,7 +103,7 @@ class FrameTransformAdapter(ROSAdapterBase):
         return FrameTransform(
             transforms=[
                 TransformAdapter.from_dict(ros_transf_dict)
-                for ros_transf_dict in list(ros_data["transforms"])
+                for ros_transf_dict in ros_data["transforms"]
             ],
         )
 
@@ -1,14 +1,26 @@
-from typing import Any
+from typing import Any, Dict
 import numpy as np
 
+# Byte buffer field of the image messages: the payload is only ever packed into
+# `bytes` by the adapters, so the (single copy) conversion is done here instead
+# of creating a list with one Python int per byte
+_IMAGE_BUFFER_FIELDS: Dict[str, str] = {
+    "sensor_msgs/msg/Image": "data",
+    "sensor_msgs/msg/CompressedImage": "data",
+}
+
 
 def _to_dict(message: Any) -> Any:
     """
     Recursively converts a rosbags message object and its nested fields
     to a standard Python dictionary or a list/primitive type if encountered
     during recursion.
+
+    The `uint8` pixel buffers of the image messages are returned as `bytes`;
+    any other array is returned as a list.
     """
     if hasattr(message, "__msgtype__"):
+        buffer_field = _IMAGE_BUFFER_FIELDS.get(message.__msgtype__)
         data_dict = {}
         fields = getattr(
             message,
@@ -20,7 +32,14 @@ def _to_dict(message: Any) -> Any:
                 continue
             try:
                 field_value = getattr(message, field_name)
-                data_dict[field_name] = _to_dict(field_value)
+                if (
+                    field_name == buffer_field
+                    and isinstance(field_value, np.ndarray)
+                    and field_value.dtype == np.uint8
+                ):
+                    data_dict[field_name] = field_value.tobytes()
+                else:
+                    data_dict[field_name] = _to_dict(field_value)
             except AttributeError:
                 continue
         return data_dict
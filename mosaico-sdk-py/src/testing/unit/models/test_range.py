@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from mosaicolabs.models import Header, Time
+from mosaicolabs.models.sensors import Range
+
+
+def test_range_from_arrays():
+    """Test the bulk creation of Range instances from column arrays."""
+    ranges = Range.from_arrays(
+        radiation_type=np.array([0, 1, 0]),
+        field_of_view=np.full(3, 0.1),
+        min_range=np.full(3, 0.2),
+        max_range=np.full(3, 4.0),
+        range=np.array([0.5, 1.0, 3.5]),
+    )
+    assert len(ranges) == 3
+    assert [r.radiation_type for r in ranges] == [0, 1, 0]
+    assert [r.range for r in ranges] == [0.5, 1.0, 3.5]
+    # Values are stored with the float32 precision of the Arrow schema
+    assert ranges[0].field_of_view == float(np.float32(0.1))
+    assert all(r.header is None for r in ranges)
+
+
+def test_range_from_arrays_invalid_range():
+    """Test the correct exception raise if a sample violates the range invariants."""
+    with pytest.raises(ValueError, match="Sample 1: The range must be between"):
+        Range.from_arrays(
+            radiation_type=[0, 0],
+            field_of_view=[1.0, 1.0],
+            min_range=[0.0, 0.0],
+            max_range=[1.0, 1.0],
+            range=[0.5, 2.0],
+        )
+
+    with pytest.raises(ValueError, match="Sample 0: The min_range must be smaller"):
+        Range.from_arrays(
+            radiation_type=[0],
+            field_of_view=[1.0],
+            min_range=[2.0],
+            max_range=[1.0],
+            range=[1.5],
+        )
+
+    with pytest.raises(ValueError, match="Sample 0: The radiation_type must be"):
+        Range.from_arrays(
+            radiation_type=[256, -1, 2.9],
+            field_of_view=[1.0, 1.0, 1.0],
+            min_range=[0.0, 0.0, 0.0],
+            max_range=[1.0, 1.0, 1.0],
+            range=[0.5, 0.5, 0.5],
+        )
+
+    with pytest.raises(ValueError, match="Sample 0: The radiation_type must be"):
+        Range.from_arrays(
+            radiation_type=["a"],
+            field_of_view=[1.0],
+            min_range=[0.0],
+            max_range=[1.0],
+            range=[0.5],
+        )
+
+    for radiation_type in ([0, -1], [0, 2.9], [0, float("nan")]):
+        with pytest.raises(ValueError, match="Sample 1: The radiation_type must be"):
+            Range.from_arrays(
+                radiation_type=radiation_type,
+                field_of_view=[1.0, 1.0],
+                min_range=[0.0, 0.0],
+                max_range=[1.0, 1.0],
+                range=[0.5, 0.5],
+            )
+
+
+def test_range_from_arrays_length_mismatch():
+    """Test the correct exception raise if the input arrays have different lengths."""
+    with pytest.raises(ValueError, match="same length"):
+        Range.from_arrays(
+            radiation_type=[0, 0],
+            field_of_view=[1.0, 1.0],
+            min_range=[0.0, 0.0],
+            max_range=[1.0, 1.0],
+            range=[0.5],
+        )
+
+
+def test_range_from_arrays_headers():
+    """Test that the per-sample headers are validated before building the batch."""
+    columns = dict(
+        radiation_type=[0, 0],
+        field_of_view=[1.0, 1.0],
+        min_range=[0.0, 0.0],
+        max_range=[1.0, 1.0],
+        range=[0.5, 0.5],
+    )
+    header = Header(stamp=Time(sec=1, nanosec=0), frame_id="sonar")
+    ranges = Range.from_arrays(
+        **columns,
+        headers=[header, {"stamp": {"sec": 2, "nanosec": 0}, "frame_id": "sonar"}],
+    )
+    assert ranges[0].header is header
+    assert isinstance(ranges[1].header, Header) and ranges[1].header.stamp.sec == 2
+
+    with pytest.raises(ValueError, match="Sample 1: Invalid header"):
+        Range.from_arrays(**columns, headers=[header, "garbage"])
+    with pytest.raises(ValueError, match="Expected 2 headers"):
+        Range.from_arrays(**columns, headers=[header])
@@ -0,0 +1,17 @@
+import numpy as np
+
+from mosaicolabs.models.sensors import RobotJoint
+
+
+def test_robot_joint_from_ndarray():
+    """Test the creation of a RobotJoint from NumPy arrays."""
+    joint = RobotJoint(
+        names=["joint1", "joint2"],
+        positions=np.array([0.5, 1.5]),
+        velocities=np.array([1, 2], dtype=np.int32),
+        efforts=[0.0, 0.1],
+    )
+    assert joint.positions == [0.5, 1.5]
+    assert joint.velocities == [1.0, 2.0]
+    assert all(type(v) is float for v in joint.velocities)
+    assert joint.efforts == [0.0, 0.1]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from mosaicolabs.models import Header, Time
+from mosaicolabs.models.sensors import Temperature
+
+
+def test_temperature_from_celsius_batch():
+    """Test that the batch conversion matches the scalar one."""
+    values = [-40.0, 0.0, 21.5, 100.0]
+    temps = Temperature.from_celsius_batch(np.array(values))
+
+    assert [t.value for t in temps] == [
+        Temperature.from_celsius(value=v).value for v in values
+    ]
+    assert all(t.header is None for t in temps)
+
+
+def test_temperature_from_fahrenheit_batch():
+    """Test that the batch conversion matches the scalar one."""
+    values = [-40.0, 32.0, 70.7, 212.0]
+    temps = Temperature.from_fahrenheit_batch(values)
+
+    assert [t.value for t in temps] == [
+        Temperature.from_fahrenheit(value=v).value for v in values
+    ]
+
+
+def test_temperature_batch_headers_mismatch():
+    """Test the correct exception raise if the headers do not match the values."""
+    with pytest.raises(ValueError, match="Expected 2 headers"):
+        Temperature.from_celsius_batch([1.0, 2.0], headers=[None])
+
+    with pytest.raises(ValueError, match="Sample 0: Invalid header"):
+        Temperature.from_celsius_batch([1.0], headers=["garbage"])
+
+
+def test_temperature_batch_headers_and_variances():
+    """Test that the batch carries the same metadata as the scalar factories."""
+    header = Header(stamp=Time(sec=1, nanosec=0), frame_id="thermo")
+    temps = Temperature.from_fahrenheit_batch(
+        [32.0, 50.0], headers=[header, None], variances=[0.1, 0.2], variance_type=3
+    )
+    assert temps[0] == Temperature.from_fahrenheit(
+        value=32.0, header=header, variance=0.1, variance_type=3
+    )
+    assert temps[1].header is None and temps[1].variance == 0.2
+
+    with pytest.raises(ValueError, match="Expected 2 variances"):
+        Temperature.from_celsius_batch([1.0, 2.0], variances=[0.1])
+    with pytest.raises(ValueError, match="variance_type must be an integer"):
+        Temperature.from_celsius_batch([1.0], variance_type=1.5)
@@ -27,6 +27,7 @@ from mosaicolabs.models.query.expressions import (
 )
 
 from mosaicolabs.models.query.protocols import QueryableProtocol
+from mosaicolabs.models.sensors import IMU
 
 import pytest
 
@@ -409,3 +410,12 @@ def test_qyeryable_unsupported_no_operators(operator: str):
     field = cls("", _QueryExpression)
     with pytest.raises(AttributeError, match="provides no operators."):
         getattr(field, operator)
+
+
+def test_query_proxy_reuses_nested_proxies():
+    """Test that nested proxies are built once and keep the full field path."""
+    assert IMU.Q.acceleration is IMU.Q.acceleration
+    assert IMU.Q.header.stamp is IMU.Q.header.stamp
+    assert IMU.Q.header.stamp.sec.gt(0).to_dict() == {
+        "imu.header.stamp.sec": {"$gt": 0}
+    }
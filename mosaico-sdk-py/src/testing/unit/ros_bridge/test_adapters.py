@@ -0,0 +1,301 @@
+import pytest
+
+from mosaicolabs.models import Header
+from mosaicolabs.models.data import Vector3d
+from mosaicolabs.ros_bridge.adapter_base import ROSAdapterBase, ROSTranslationError
+from mosaicolabs.ros_bridge.adapters.helpers import _make_header, _validate_msgdata
+from mosaicolabs.ros_bridge.adapters.sensor_msgs import (
+    CameraInfoAdapter,
+    GPSAdapter,
+    IMUAdapter,
+)
+from mosaicolabs.ros_bridge.adapters.geometry_msgs import (
+    PoseAdapter,
+    TransformAdapter,
+    Vector3Adapter,
+)
+from mosaicolabs.ros_bridge.ros_message import ROSMessage
+
+
+def _make_header_dict(sec: int, nanosec: int, frame_id: str = "base_link") -> dict:
+    return {"stamp": {"sec": sec, "nanosec": nanosec}, "frame_id": frame_id}
+
+
+def _make_vector3_stamped(sec: int, x: float) -> ROSMessage:
+    return ROSMessage(
+        bag_timestamp_ns=sec * 1_000_000_000 + 500,
+        topic="/vector",
+        msg_type="geometry_msgs/msg/Vector3Stamped",
+        data={
+            "header": _make_header_dict(sec, 0),
+            "vector": {"x": x, "y": 0.0, "z": 0.0},
+        },
+    )
+
+
+def test_translate_batch_matches_translate():
+    """Test that the batch translation yields the same messages as the single one."""
+    ros_msgs = [_make_vector3_stamped(sec, float(sec)) for sec in range(1, 4)]
+
+    batch = Vector3Adapter.translate_batch(ros_msgs)
+    single = [Vector3Adapter.translate(ros_msg) for ros_msg in ros_msgs]
+
+    assert len(batch) == len(single)
+    for bmsg, smsg in zip(batch, single):
+        assert isinstance(bmsg.data, Vector3d)
+        assert bmsg.timestamp_ns == smsg.timestamp_ns
+        assert bmsg.recording_timestamp_ns == smsg.recording_timestamp_ns
+        assert bmsg.data == smsg.data
+        assert bmsg._encode() == smsg._encode()
+
+
+def test_translate_batch_failure():
+    """Test the correct exception raise if a message of the batch is malformed."""
+    ros_msgs = [_make_vector3_stamped(1, 1.0), _make_vector3_stamped(2, 2.0)]
+    del ros_msgs[1].data["vector"]["z"]
+
+    with pytest.raises(ROSTranslationError, match="Translation failed for /vector"):
+        Vector3Adapter.translate_batch(ros_msgs)
+
+
+class _DictsVector3Adapter(Vector3Adapter):
+    """Broken adapter whose batch conversion returns plain dictionaries."""
+
+    @classmethod
+    def from_dicts(cls, ros_data_list):
+        return [dict(ros_data) for ros_data in ros_data_list]
+
+
+def test_translate_batch_invalid_payloads():
+    """Test that the batch envelopes are only built for Serializable payloads."""
+    with pytest.raises(ROSTranslationError, match="must return 'Serializable'"):
+        _DictsVector3Adapter.translate_batch([_make_vector3_stamped(1, 1.0)])
+
+
+def test_translate_failure():
+    """Test that the translation error keeps the topic and the original cause."""
+    ros_msg = _make_vector3_stamped(1, 1.0)
+    del ros_msg.data["vector"]["z"]
+
+    with pytest.raises(ROSTranslationError) as exc_info:
+        Vector3Adapter.translate(ros_msg)
+
+    assert exc_info.value.topic == "/vector"
+    assert isinstance(exc_info.value.cause, ValueError)
+    assert exc_info.value.__cause__ is exc_info.value.cause
+
+
+class _CaseInsensitiveAdapter(ROSAdapterBase):
+    """Minimal adapter used to exercise the required keys validation."""
+
+    ros_msgtype = "test_msgs/msg/Calibration"
+    _REQUIRED_KEYS = ("d", "k")
+
+
+def test_validate_msgdata():
+    """Test the required keys validation, with exact and case-insensitive names."""
+    assert _CaseInsensitiveAdapter._REQUIRED_KEYS_SET == frozenset({"d", "k"})
+
+    # Exact and extra keys
+    _validate_msgdata(_CaseInsensitiveAdapter, {"d": [], "k": [], "extra": 0})
+    # ROS1-style upper case keys
+    _validate_msgdata(
+        _CaseInsensitiveAdapter, {"D": [], "K": []}, case_insensitive=True
+    )
+
+    with pytest.raises(ValueError, match=r"missing required keys \['k'\]"):
+        _validate_msgdata(_CaseInsensitiveAdapter, {"d": [], "K": []})
+    with pytest.raises(ValueError, match=r"missing required keys \['d'\]"):
+        _validate_msgdata(_CaseInsensitiveAdapter, {"k": []}, case_insensitive=True)
+
+
+class _LateKeysAdapter(ROSAdapterBase):
+    """Minimal adapter declaring the required keys after the class creation."""
+
+    ros_msgtype = "test_msgs/msg/Late"
+
+
+def test_validate_msgdata_undeclared_keys():
+    """Test that a missing `_REQUIRED_KEYS` is never treated as an empty set."""
+    with pytest.raises(AttributeError, match="_REQUIRED_KEYS"):
+        _validate_msgdata(_LateKeysAdapter, {"a": 0})
+
+    _LateKeysAdapter._REQUIRED_KEYS = ("a",)
+    _validate_msgdata(_LateKeysAdapter, {"a": 0})
+    assert _LateKeysAdapter._REQUIRED_KEYS_SET == frozenset({"a"})
+    with pytest.raises(ValueError, match=r"missing required keys \['a'\]"):
+        _validate_msgdata(_LateKeysAdapter, {"b": 0})
+
+
+def test_translate_timestamp_from_header():
+    """Test that the message timestamp comes from the ROS header, if any."""
+    ros_msg = _make_vector3_stamped(7, 1.0)
+
+    msg = Vector3Adapter.translate(ros_msg)
+    assert msg.timestamp_ns == 7_000_000_000
+    assert msg.recording_timestamp_ns == 7_000_000_500
+
+    # Without header, the bag timestamp is used
+    ros_msg.header = None
+    assert Vector3Adapter.translate(ros_msg).timestamp_ns == 7_000_000_500
+    assert Vector3Adapter.translate_batch([ros_msg])[0].timestamp_ns == 7_000_000_500
+
+
+def test_from_dict_unwraps_stamped():
+    """Test that the wrapper levels are unwrapped down to the leaf, keeping the header."""
+    ros_data = {
+        "header": _make_header_dict(3, 25, frame_id="map"),
+        "pose": {
+            "position": {"x": 1.0, "y": 2.0, "z": 3.0},
+            "orientation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+        },
+    }
+    pose = PoseAdapter.from_dict(ros_data)
+    assert pose.position.x == 1.0 and pose.position.z == 3.0
+    assert pose.orientation.w == 1.0
+    assert pose.header is not None
+    assert pose.header.frame_id == "map"
+    assert pose.header.stamp.sec == 3 and pose.header.stamp.nanosec == 25
+    assert pose.covariance is None
+
+    # The leaf node alone carries no metadata
+    assert PoseAdapter.from_dict(ros_data["pose"]).header is None
+
+    with pytest.raises(ValueError, match="Invalid type for 'pose' value"):
+        PoseAdapter.from_dict({"header": ros_data["header"], "pose": [1.0]})
+
+    # An empty wrapper is descended as well: the error refers to the inner node
+    with pytest.raises(ValueError, match=r"Available keys: \[\]"):
+        PoseAdapter.from_dict({"header": ros_data["header"], "pose": {}})
+
+
+def test_from_dict_keeps_inner_covariance():
+    """Test that the covariance of PoseWithCovariance survives the outer Stamped level."""
+    covariance = [float(i) for i in range(36)]
+    ros_data = {
+        "header": _make_header_dict(5, 0, frame_id="odom"),
+        "pose": {
+            "pose": {
+                "position": {"x": 1.0, "y": 0.0, "z": 0.0},
+                "orientation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+            },
+            "covariance": covariance,
+        },
+    }
+    pose = PoseAdapter.from_dict(ros_data)
+    assert pose.header is not None and pose.header.frame_id == "odom"
+    assert pose.covariance == covariance
+
+
+def test_transform_from_dict_stamped():
+    """Test that TransformStamped keeps the header and the child frame id."""
+    ros_data = {
+        "header": _make_header_dict(9, 0, frame_id="world"),
+        "child_frame_id": "base_link",
+        "transform": {
+            "translation": {"x": 1.0, "y": 2.0, "z": 3.0},
+            "rotation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+        },
+    }
+    transform = TransformAdapter.from_dict(ros_data)
+    assert transform.translation.y == 2.0
+    assert transform.rotation.w == 1.0
+    assert transform.header is not None and transform.header.frame_id == "world"
+    assert transform.target_frame_id == "base_link"
+
+    bare = TransformAdapter.from_dict(ros_data["transform"])
+    assert bare.header is None and bare.target_frame_id is None
+
+
+def test_make_header():
+    """Test that the headers built from ROS dicts are validated."""
+    ros2_header = _make_header_dict(12, 345, frame_id="camera")
+    ros1_header = {**ros2_header, "seq": 7}
+
+    for ros_header in (ros2_header, ros1_header):
+        header = _make_header(ros_header)
+        assert header == Header(**ros_header)
+        assert header.stamp.to_nanoseconds() == 12_000_000_345
+    assert _make_header(ros1_header).seq == 7
+    assert _make_header(None) is None
+
+    # Nested headers are not checked upstream: the validators must run here
+    with pytest.raises(ValueError):
+        _make_header({"stamp": {"sec": 1, "nanosec": 5_000_000_000}, "frame_id": "a"})
+    with pytest.raises(ValueError):
+        _make_header({"stamp": {"sec": 1, "nanosec": 0}, "frame_id": 3})
+    with pytest.raises(ValueError):
+        _make_header({"frame_id": "a"})
+
+
+def _make_camera_info_dict(upper_case: bool) -> dict:
+    matrices = {
+        "d": [],
+        "k": [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+        "p": [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+        "r": [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+    }
+    return {
+        "header": _make_header_dict(1, 0, frame_id="camera"),
+        "height": 480,
+        "width": 640,
+        "binning_x": 0,
+        "binning_y": 0,
+        "roi": {
+            "x_offset": 0,
+            "y_offset": 0,
+            "height": 0,
+            "width": 0,
+            "do_rectify": False,
+        },
+        "distortion_model": "plumb_bob",
+        **{(k.upper() if upper_case else k): v for k, v in matrices.items()},
+    }
+
+
+def test_camera_info_from_dict_ros1_ros2_keys():
+    """Test the ROS2 (lower case) and ROS1 (upper case) calibration matrices keys."""
+    for upper_case in (False, True):
+        camera_info = CameraInfoAdapter.from_dict(_make_camera_info_dict(upper_case))
+        # An empty distortion vector is a valid value, not a missing key
+        assert camera_info.distortion_parameters == []
+        assert camera_info.intrinsic_parameters[4] == 1.0
+        assert len(camera_info.projection_parameters) == 12
+        assert camera_info.rectification_parameters[8] == 1.0
+
+
+def test_imu_from_dict_covariances():
+    """Test that all-zero ROS covariances are treated as not provided."""
+    ros_data = {
+        "header": _make_header_dict(2, 0, frame_id="imu_link"),
+        "linear_acceleration": {"x": 0.0, "y": 0.0, "z": 9.81},
+        "angular_velocity": {"x": 0.0, "y": 0.0, "z": 0.1},
+        "orientation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+        "orientation_covariance": [0.0] * 9,
+        "linear_acceleration_covariance": [0.01] + [0.0] * 8,
+        "angular_velocity_covariance": [-0.0] * 9,
+    }
+    imu = IMUAdapter.from_dict(ros_data)
+    assert imu.orientation is not None and imu.orientation.covariance is None
+    assert imu.acceleration.covariance == ros_data["linear_acceleration_covariance"]
+    assert imu.angular_velocity.covariance is None
+
+    # Orientation not provided by the sensor
+    ros_data["orientation_covariance"] = [-1.0] + [0.0] * 8
+    assert IMUAdapter.from_dict(ros_data).orientation is None
+
+
+def test_gps_schema_metadata():
+    """Test that the prefixed ROS constants are collected as schema metadata."""
+    ros_data = {
+        "latitude": 45.0,
+        "COVARIANCE_TYPE_UNKNOWN": 0,
+        "COVARIANCE_TYPE_KNOWN": 3,
+        "status": {"status": 0, "service": 1, "STATUS_FIX": 0, "SERVICE_GPS": 1},
+    }
+    assert GPSAdapter.schema_metadata(ros_data) == {
+        "COVARIANCE_TYPE_UNKNOWN": 0,
+        "COVARIANCE_TYPE_KNOWN": 3,
+        "status": {"STATUS_FIX": 0, "SERVICE_GPS": 1},
+    }
+    assert GPSAdapter.schema_metadata({"latitude": 45.0}) is None
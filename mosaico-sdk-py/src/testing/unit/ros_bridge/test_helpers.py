@@ -0,0 +1,36 @@
+import numpy as np
+
+from mosaicolabs.ros_bridge.helpers import _to_dict
+
+
+class _FakeCompressedImage:
+    """Minimal stand-in for a rosbags CompressedImage message object."""
+
+    __msgtype__ = "sensor_msgs/msg/CompressedImage"
+    __slots__ = ("format", "data")
+
+    def __init__(self, format, data):
+        self.format = format
+        self.data = data
+
+
+class _FakeByteMultiArray:
+    """Minimal stand-in for a rosbags UInt8MultiArray message object."""
+
+    __msgtype__ = "std_msgs/msg/UInt8MultiArray"
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+def test_to_dict_image_buffers():
+    """Test that only the image pixel buffers are converted to bytes."""
+    payload = np.array([255, 216, 255, 224], dtype=np.uint8)
+
+    ros_data = _to_dict(_FakeCompressedImage(format="jpeg", data=payload))
+    assert ros_data["format"] == "jpeg"
+    assert ros_data["data"] == b"\xff\xd8\xff\xe0"
+
+    # The uint8 arrays of the other messages are still lists of ints
+    assert _to_dict(_FakeByteMultiArray(data=payload)) == {"data": [255, 216, 255, 224]}